@@ -1,631 +1,930 @@
-#!/usr/bin/env python3
-"""
-Utility to batch-run all general Sudoku instances through the ACS solver.
-
-Example:
-    python scripts/run_general.py --verbose
-"""
-from __future__ import annotations
-
-import argparse
-import csv
-import os
-import re
-import sys
-import statistics
-from dataclasses import dataclass
-from pathlib import Path
-from subprocess import CompletedProcess, run, PIPE
-from typing import Iterable, List, Optional, Sequence, Tuple
-
-
-@dataclass(frozen=True)
-class InstanceMetadata:
-    path: Path
-    size_label: str
-    fixed_percentage: Optional[int]
-    instance_id: Optional[int]
-
-    @property
-    def relative_path(self) -> str:
-        repo_root = find_repo_root()
-        return str(self.path.relative_to(repo_root))
-
-
-def find_repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
-
-
-def default_solver_candidates() -> Sequence[str]:
-    if os.name == "nt":
-        return (
-            "sudoku_ants.exe",
-            "sudoku_ants",
-            os.path.join("vs2017", "x64", "Release", "sudoku_ants.exe"),
-            os.path.join("vs2017", "Release", "sudoku_ants.exe"),
-        )
-    return (
-        "./sudoku_ants",
-        "sudoku_ants",
-        os.path.join("vs2017", "x64", "Release", "sudoku_ants"),
-        os.path.join("vs2017", "Release", "sudoku_ants"),
-    )
-
-
-def resolve_solver_path(user_value: Optional[str]) -> Path:
-    repo_root = find_repo_root()
-    if user_value:
-        solver_path = Path(user_value)
-        if not solver_path.is_absolute():
-            solver_path = (repo_root / solver_path).resolve()
-        if solver_path.exists():
-            return solver_path
-        raise FileNotFoundError(f"Solver binary not found at '{solver_path}'.")
-
-    for candidate in default_solver_candidates():
-        candidate_path = (repo_root / candidate).resolve()
-        if candidate_path.exists() and candidate_path.is_file():
-            return candidate_path
-
-    raise FileNotFoundError(
-        "Solver binary not found. Build it first (e.g. run `make -f Makefile`)."
-    )
-
-
-def natural_sort_key(path: Path) -> list:
-    """
-    Generate a sort key that handles numeric parts naturally.
-    E.g., '9x9hard_2' comes before '9x9hard_10'
-    """
-    import re
-    parts = []
-    for part in re.split(r'(\d+)', path.name):
-        if part.isdigit():
-            parts.append(int(part))
-        else:
-            parts.append(part)
-    return parts
-
-
-def iter_instance_files(instances_root: Path) -> Iterable[Path]:
-    if not instances_root.exists():
-        raise FileNotFoundError(f"Instances folder not found: '{instances_root}'.")
-    # Find all .txt files and files without extensions (for "hard" folder)
-    all_files = list(instances_root.glob("*.txt"))
-    # Also include files without extensions (filter out directories)
-    all_files.extend([f for f in instances_root.glob("*") if f.is_file() and f.suffix == ""])
-    # Sort naturally so 9x9hard_1, 9x9hard_2, ... 9x9hard_10 are in correct order
-    return sorted(all_files, key=natural_sort_key)
-
-
-def iter_all_instance_files(repo_root: Path) -> Iterable[Path]:
-    """Iterate over both general and logic-solvable instances."""
-    all_files = []
-    
-    # General instances
-    general_root = repo_root / "instances" / "general"
-    if general_root.exists():
-        all_files.extend(general_root.glob("*.txt"))
-    
-    # Logic-solvable instances
-    logic_root = repo_root / "instances" / "logic-solvable"
-    if logic_root.exists():
-        all_files.extend(logic_root.glob("*.txt"))
-    
-    if not all_files:
-        raise FileNotFoundError("No instance files found in 'instances/general' or 'instances/logic-solvable'.")
-    
-    return sorted(all_files)
-
-
-def parse_metadata(path: Path) -> InstanceMetadata:
-    name = path.stem
-    match = re.match(r"inst(?P<size>[0-9x]+)_(?P<fixed>\d+)_(?P<idx>\d+)", name)
-    size = None
-    fixed = None
-    idx = None
-    if match:
-        size = match.group("size")
-        fixed = int(match.group("fixed"))
-        idx = int(match.group("idx"))
-    else:
-        # Logic-solvable instances: use puzzle name as size_label
-        size = name
-    return InstanceMetadata(path=path, size_label=size or "unknown", fixed_percentage=fixed, instance_id=idx)
-
-
-def sort_instance_metadata(instances: Sequence[InstanceMetadata]) -> List[InstanceMetadata]:
-    size_order = {"9x9": 0, "16x16": 1, "25x25": 2, "36x36": 3}
-
-    def key(meta: InstanceMetadata) -> Tuple[int, int, int, list]:
-        return (
-            size_order.get(meta.size_label, 99),
-            meta.fixed_percentage if meta.fixed_percentage is not None else 999,
-            meta.instance_id if meta.instance_id is not None else 999,
-            natural_sort_key(meta.path),
-        )
-
-    return sorted(instances, key=key)
-
-
-def format_instance_argument(instance_path: Path, repo_root: Path) -> str:
-    try:
-        rel_path = instance_path.relative_to(repo_root)
-    except ValueError:
-        path_str = str(instance_path)
-    else:
-        prefixed = Path(".") / rel_path
-        path_str = str(prefixed)
-    
-    # Quote paths with spaces (for Windows compatibility)
-    if ' ' in path_str:
-        return f'"{path_str}"'
-    return path_str
-
-
-def build_solver_command(
-    solver_path: Path,
-    instance_path: Path,
-    repo_root: Path,
-    args: argparse.Namespace,
-) -> List[str]:
-    file_arg = format_instance_argument(instance_path, repo_root)
-    cmd: List[str] = [str(solver_path), "--file", file_arg, "--alg", str(args.alg), "--timeout", str(args.timeout)]
-
-    if args.ants is not None:
-        cmd.extend(("--ants", str(args.ants)))
-    if args.subcolonies is not None:
-        cmd.extend(("--subcolonies", str(args.subcolonies)))
-    if args.q0 is not None:
-        cmd.extend(("--q0", str(args.q0)))
-    if args.rho is not None:
-        cmd.extend(("--rho", str(args.rho)))
-    if args.evap is not None:
-        cmd.extend(("--evap", str(args.evap)))
-    # Always add verbose for algorithms 0 and 2 to get iteration count
-    if args.alg == 0 or args.alg == 2 or args.solver_verbose:
-        cmd.append("--verbose")
-    return cmd
-
-
-def run_solver(cmd: Sequence[str], cwd: Path, timeout: Optional[float], show_progress: bool = False) -> CompletedProcess:
-    if show_progress:
-        # Don't capture stderr so progress messages show in real-time
-        return run(
-            list(cmd),
-            cwd=str(cwd),
-            stdout=PIPE,
-            stderr=None,  # Let stderr go directly to console
-            text=True,
-            timeout=timeout,
-        )
-    else:
-        return run(
-            list(cmd),
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-
-
-def parse_solver_output(stdout: str, stderr: str) -> Tuple[Optional[bool], Optional[float], Optional[int], Optional[bool], Optional[float], Optional[float], Optional[int], str, str]:
-    stdout_lines = [line.strip() for line in stdout.splitlines() if line.strip()]
-    stderr_lines = [line.strip() for line in stderr.splitlines() if line.strip()]
-
-    success: Optional[bool] = None
-    solve_time: Optional[float] = None
-    iterations: Optional[int] = None
-    communication: Optional[bool] = None
-    cp_initial: Optional[float] = None
-    cp_ant: Optional[float] = None
-    cp_calls: Optional[int] = None
-
-    # Combine stdout and stderr for parsing (iterations might be in either)
-    all_lines = stdout_lines + stderr_lines
-
-    for line in all_lines:
-        if line in {"0", "1"} and success is None:
-            success = (line == "0")
-            continue
-
-        solved_match = re.search(r"solved in ([0-9]*\.?[0-9]+)", line)
-        if solved_match:
-            solve_time = float(solved_match.group(1))
-            success = True
-            continue
-
-        failed_match = re.search(r"failed in time ([0-9]*\.?[0-9]+)", line)
-        if failed_match:
-            solve_time = float(failed_match.group(1))
-            success = False
-            continue
-
-        # Parse iterations (for algorithms 0 and 2)
-        iter_match = re.search(r"iterations:\s*([0-9]+)", line, re.IGNORECASE)
-        if iter_match:
-            iterations = int(iter_match.group(1))
-            continue
-
-        # Parse communication flag for algorithm 2
-        comm_match = re.search(r"communication:\s*(yes|no)", line, re.IGNORECASE)
-        if comm_match:
-            communication = (comm_match.group(1).lower() == "yes")
-            continue
-        
-        # Parse CP timing data
-        cp_initial_match = re.search(r"cp_initial:\s*([0-9]*\.?[0-9]+)", line)
-        if cp_initial_match:
-            cp_initial = float(cp_initial_match.group(1))
-            continue
-        
-        cp_ant_match = re.search(r"cp_ant:\s*([0-9]*\.?[0-9]+)", line)
-        if cp_ant_match:
-            cp_ant = float(cp_ant_match.group(1))
-            continue
-        
-        cp_calls_match = re.search(r"cp_calls:\s*([0-9]+)", line)
-        if cp_calls_match:
-            cp_calls = int(cp_calls_match.group(1))
-            continue
-
-    # Fallback: check stdout for time if not found yet
-    for line in stdout_lines:
-        # Fallback: if a line can be parsed as float and we still do not have a time.
-        if solve_time is None:
-            try:
-                solve_time = float(line)
-            except ValueError:
-                pass
-
-    if success is None:
-        # Check stderr for clues
-        for line in stderr_lines:
-            if "could not open file" in line.lower():
-                success = False
-                break
-
-    if solve_time is not None:
-        solve_time = round(solve_time, 5)
-
-    return success, solve_time, iterations, communication, cp_initial, cp_ant, cp_calls, "\n".join(stdout_lines), "\n".join(stderr_lines)
-
-
-def write_csv(output_path: Path, rows: Sequence[dict]) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["alg", "puzzle_size", "f%", "ants", "subcolonies", "q0", "rho", "bve", "timeout", "success_rate", "time_mean", "time_std", "iter_mean", "with_comm", "without_comm", "cp_initial_mean", "cp_ant_mean", "cp_total_mean", "cp_percentage"]
-    with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-
-def compute_summary(total: int, successes: int, times: Sequence[float]) -> Tuple[int, int, float]:
-    avg_time = sum(times) / len(times) if times else 0.0
-    return total, successes, round(avg_time, 5)
-
-
-def summarize_group(size_label: str, fixed_percentage: Optional[int], stats: dict, args: argparse.Namespace) -> dict:
-    total = stats.get("total", 0)
-    if total == 0:
-        return {}
-
-    successes = stats.get("successes", 0)
-    fails = stats.get("fails", 0)
-    times = stats.get("times", [])
-    iterations = stats.get("iterations", [])
-    with_comm = stats.get("with_comm", 0)
-    without_comm = stats.get("without_comm", 0)
-    cp_initial_list = stats.get("cp_initial", [])
-    cp_ant_list = stats.get("cp_ant", [])
-    cp_calls_list = stats.get("cp_calls", [])
-    
-    success_rate = (successes / total) * 100.0 if total else 0.0
-    average_time = round(sum(times) / len(times), 5) if times else 0.0
-    time_std = round(statistics.pstdev(times), 5) if len(times) > 1 else 0.0
-    average_iter = round(sum(iterations) / len(iterations), 2) if iterations else 0.0
-    
-    # Calculate CP timing statistics
-    avg_cp_initial = round(sum(cp_initial_list) / len(cp_initial_list), 6) if cp_initial_list else 0.0
-    avg_cp_ant = round(sum(cp_ant_list) / len(cp_ant_list), 6) if cp_ant_list else 0.0
-    avg_cp_total = avg_cp_initial + avg_cp_ant
-    avg_cp_percentage = round((avg_cp_total / average_time * 100), 2) if average_time > 0 else 0.0
-
-    label = size_label
-    if fixed_percentage is not None:
-        label = f"{label} @ {fixed_percentage}% fixed"
-
-    # Build summary message
-    summary_msg = f"Summary {label}: success={successes}, fail={fails}, success_rate={success_rate:.2f}%, avg_time={average_time:.5f}s"
-    
-    if iterations:
-        summary_msg += f", avg_iter={average_iter:.2f}"
-    
-    if args.alg == 2 and (with_comm > 0 or without_comm > 0):
-        summary_msg += f", comm={with_comm}/{with_comm + without_comm}"
-    
-    # Add CP timing to summary
-    if cp_initial_list and cp_ant_list:
-        summary_msg += f", CP: {avg_cp_total:.6f}s ({avg_cp_percentage:.1f}%)"
-    
-    print(summary_msg)
-    sys.stdout.flush()  # Force immediate output to prevent timing issues
-
-    # Get actual ant count (default is 10)
-    actual_ants = args.ants if args.ants is not None else 10
-    
-    # Get actual subcolonies count (default is 4)
-    actual_subcolonies = args.subcolonies if args.subcolonies is not None else 4
-
-    return {
-        "alg": args.alg,
-        "puzzle_size": size_label,
-        "f%": fixed_percentage if fixed_percentage is not None else "",
-        "ants": actual_ants,
-        "subcolonies": actual_subcolonies,
-        "q0": args.q0,
-        "rho": args.rho,
-        "bve": args.evap,
-        "timeout": args.timeout,
-        "success_rate": round(success_rate, 2),
-        "time_mean": average_time,
-        "time_std": time_std,
-        "iter_mean": average_iter if (args.alg == 0 or args.alg == 2) else "",
-        "with_comm": with_comm if args.alg == 2 else "",
-        "without_comm": without_comm if args.alg == 2 else "",
-        "cp_initial_mean": avg_cp_initial if cp_initial_list else "",
-        "cp_ant_mean": avg_cp_ant if cp_ant_list else "",
-        "cp_total_mean": avg_cp_total if (cp_initial_list and cp_ant_list) else "",
-        "cp_percentage": avg_cp_percentage if (cp_initial_list and cp_ant_list) else "",
-    }
-
-
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Run all general Sudoku instances through the solver.")
-    parser.add_argument("--instances-root", default=None, help="Folder containing instances (default: runs both instances/general AND instances/logic-solvable)")
-    parser.add_argument("--solver", default=None, help="Path to the solver executable (default: auto-detect)")
-    parser.add_argument("--output", default="results/general_metrics.csv", help="Destination CSV file for metrics.")
-    parser.add_argument("--alg", type=int, default=0, help="Solver algorithm (0=ACS, 1=backtracking).")
-    parser.add_argument("--timeout", type=float, default=120.0, help="Timeout per puzzle in seconds (default: 120).")
-    parser.add_argument("--ants", type=int, default=None, help="Override number of ants (ACS only).")
-    parser.add_argument("--subcolonies", type=int, default=None, help="Number of sub-colonies for parallel ACS (alg=2, default: 4).")
-    parser.add_argument("--q0", type=float, default=0.9, help="Override ACS q0 parameter.")
-    parser.add_argument("--rho", type=float, default=0.9, help="Override ACS rho parameter.")
-    parser.add_argument("--evap", type=float, default=0.005, help="Override ACS evaporation parameter.")
-    parser.add_argument("--limit", type=int, default=None, help="Optional cap on number of instances to process.")
-    parser.add_argument("--puzzle-size", dest="puzzle_sizes", nargs="+", choices=["9x9", "16x16", "25x25", "36x36"], help="Filter by puzzle size(s), e.g. --puzzle-size 25x25.")
-    parser.add_argument("--fixed-percentage", dest="fixed_percentages", type=int, nargs="+", help="Filter by fixed-cell percentage(s), e.g. --fixed-percentage 40.")
-    parser.add_argument("--solver-timeout", type=float, default=None, help="Wall-clock timeout applied to each solver invocation.")
-    parser.add_argument("--solver-verbose", action="store_true", help="Pass --verbose to the solver binary.")
-    parser.add_argument("--verbose", action="store_true", default=True, help="Print per-instance progress to the console (default: True).")
-    parser.add_argument("--no-verbose", dest="verbose", action="store_false", help="Disable per-instance progress output.")
-
-    args = parser.parse_args()
-
-    repo_root = find_repo_root()
-
-    try:
-        solver_path = resolve_solver_path(args.solver)
-    except FileNotFoundError as exc:
-        print(exc, file=sys.stderr)
-        return 1
-
-    # Determine which instances to run
-    if args.instances_root is not None:
-        # User specified a specific folder
-        instances_root = (repo_root / args.instances_root).resolve()
-        try:
-            instance_files = list(iter_instance_files(instances_root))
-        except FileNotFoundError as exc:
-            print(exc, file=sys.stderr)
-            return 1
-        if not instance_files:
-            print(f"No instances found in '{instances_root}'.", file=sys.stderr)
-            return 1
-        instances_root_display = instances_root
-    else:
-        # Default: run both general and logic-solvable instances
-        try:
-            instance_files = list(iter_all_instance_files(repo_root))
-        except FileNotFoundError as exc:
-            print(exc, file=sys.stderr)
-            return 1
-        instances_root_display = repo_root / "instances" / "(general + logic-solvable)"
-
-    metadata_list = sort_instance_metadata([parse_metadata(path) for path in instance_files])
-
-    if args.puzzle_sizes:
-        allowed_sizes = set(args.puzzle_sizes)
-        metadata_list = [meta for meta in metadata_list if meta.size_label in allowed_sizes]
-
-    if args.fixed_percentages:
-        allowed_fixed = set(args.fixed_percentages)
-        metadata_list = [
-            meta
-            for meta in metadata_list
-            if meta.fixed_percentage is not None and meta.fixed_percentage in allowed_fixed
-        ]
-
-    if not metadata_list:
-        print("No instances match the specified filters.", file=sys.stderr)
-        return 1
-
-    if args.limit is not None:
-        metadata_list = metadata_list[: args.limit]
-
-    group_rows: List[dict] = []
-    total_instances = len(metadata_list)
-    current_group_key: Optional[Tuple[str, Optional[int]]] = None
-    group_stats = {"total": 0, "successes": 0, "fails": 0, "times": [], "iterations": [], "with_comm": 0, "without_comm": 0, "cp_initial": [], "cp_ant": [], "cp_calls": []}
-    overall_total = 0
-    overall_successes = 0
-    overall_times: List[float] = []
-    overall_iterations: List[int] = []
-    overall_with_comm = 0
-    overall_without_comm = 0
-
-    for idx, metadata in enumerate(metadata_list, start=1):
-        # Determine if this is a logic-solvable instance (no fixed_percentage)
-        is_logic_solvable = metadata.fixed_percentage is None
-        num_runs = 100 if is_logic_solvable else 1
-        
-        # Group key for statistics
-        group_key = (metadata.size_label, metadata.fixed_percentage)
-        if current_group_key is None:
-            current_group_key = group_key
-        elif group_key != current_group_key:
-            row = summarize_group(current_group_key[0], current_group_key[1], group_stats, args)
-            if row:
-                group_rows.append(row)
-            group_stats = {"total": 0, "successes": 0, "fails": 0, "times": [], "iterations": [], "with_comm": 0, "without_comm": 0, "cp_initial": [], "cp_ant": [], "cp_calls": []}
-            current_group_key = group_key
-        
-        # Run the puzzle num_runs times (100 for logic-solvable, 1 for general)
-        for run_num in range(1, num_runs + 1):
-            cmd = build_solver_command(solver_path, metadata.path, repo_root, args)
-            # Show progress for algorithm 2 when verbose is enabled
-            show_progress = args.verbose and args.alg == 2
-            result = run_solver(cmd, repo_root, timeout=args.solver_timeout, show_progress=show_progress)
-
-            success, solve_time, iterations, communication, cp_initial, cp_ant, cp_calls, stdout_text, stderr_text = parse_solver_output(result.stdout, result.stderr if result.stderr else "")
-
-            if success is False and (solve_time is None or solve_time == 0.0):
-                solve_time = round(float(args.timeout), 5)
-
-            if args.verbose:
-                status = "OK" if success else "FAIL" if success is not None else "UNKNOWN"
-                
-                # Build detailed timing string
-                timing_str = ""
-                if solve_time is not None:
-                    timing_str = f"{solve_time:.5f}s"
-                    
-                    # Add detailed CP breakdown if available
-                    if cp_initial is not None and cp_ant is not None and iterations is not None:
-                        total_cp = cp_initial + cp_ant
-                        aco_only = max(0.0, solve_time - total_cp)  # Pure ACO time (excluding CP)
-                        total_aco = solve_time - cp_initial  # ACO phase (including ant CP)
-                        
-                        # Calculate percentages
-                        cp_init_pct = (cp_initial / solve_time * 100) if solve_time > 0 else 0
-                        cp_ant_pct = (cp_ant / total_aco * 100) if total_aco > 0 else 0
-                        aco_only_pct = (aco_only / total_aco * 100) if total_aco > 0 else 0
-                        total_cp_pct = (total_cp / solve_time * 100) if solve_time > 0 else 0
-                        aco_total_pct = (total_aco / solve_time * 100) if solve_time > 0 else 0
-                        
-                        # Format with percentages (using 2 decimal places to show small values like CP_init)
-                        timing_str = (f"CP_init={cp_initial:.6f}s ({cp_init_pct:.2f}%), "
-                                    f"CP_ant={cp_ant:.6f}s ({cp_ant_pct:.2f}%), "
-                                    f"ACO_only={aco_only:.5f}s ({aco_only_pct:.2f}%), "
-                                    f"ACO_total={total_aco:.5f}s ({aco_total_pct:.2f}%), "
-                                    f"total_CP={total_cp:.6f}s ({total_cp_pct:.2f}%), "
-                                    f"Total={solve_time:.5f}s, {iterations} iter")
-                    elif iterations is not None:
-                        timing_str += f", {iterations} iter"
-                
-                if is_logic_solvable:
-                    # For logic-solvable, show run number
-                    if timing_str:
-                        print(f"[run {run_num}/{num_runs}] {metadata.relative_path} -> {status} ({timing_str})")
-                    else:
-                        print(f"[run {run_num}/{num_runs}] {metadata.relative_path} -> {status}")
-                else:
-                    # For general instances, show normal format
-                    if timing_str:
-                        print(f"[{idx}/{total_instances}] {metadata.relative_path} -> {status} ({timing_str})")
-                    else:
-                        print(f"[{idx}/{total_instances}] {metadata.relative_path} -> {status}")
-
-            group_stats["total"] += 1
-            if success:
-                group_stats["successes"] += 1
-            else:
-                group_stats["fails"] += 1
-            # Only include times and iterations from successful runs in statistics
-            if success and solve_time is not None:
-                group_stats["times"].append(solve_time)
-                if iterations is not None:
-                    group_stats["iterations"].append(iterations)
-                if communication is not None:
-                    if communication:
-                        group_stats["with_comm"] += 1
-                    else:
-                        group_stats["without_comm"] += 1
-                # Track CP timing statistics
-                if cp_initial is not None:
-                    if "cp_initial" not in group_stats:
-                        group_stats["cp_initial"] = []
-                    group_stats["cp_initial"].append(cp_initial)
-                if cp_ant is not None:
-                    if "cp_ant" not in group_stats:
-                        group_stats["cp_ant"] = []
-                    group_stats["cp_ant"].append(cp_ant)
-                if cp_calls is not None:
-                    if "cp_calls" not in group_stats:
-                        group_stats["cp_calls"] = []
-                    group_stats["cp_calls"].append(cp_calls)
-
-            overall_total += 1
-            if success:
-                overall_successes += 1
-            # Only include times and iterations from successful runs in statistics
-            if success and solve_time is not None:
-                overall_times.append(solve_time)
-                if iterations is not None:
-                    overall_iterations.append(iterations)
-                if communication is not None:
-                    if communication:
-                        overall_with_comm += 1
-                    else:
-                        overall_without_comm += 1
-
-    output_path = (repo_root / args.output).resolve()
-    if current_group_key is not None:
-        row = summarize_group(current_group_key[0], current_group_key[1], group_stats, args)
-        if row:
-            group_rows.append(row)
-
-    write_csv(output_path, group_rows)
-
-    total, successes, avg_time = compute_summary(overall_total, overall_successes, overall_times)
-    failures = total - successes
-    avg_iterations = round(sum(overall_iterations) / len(overall_iterations), 2) if overall_iterations else None
-
-    # Get actual ant count (default is 10)
-    actual_ants = args.ants if args.ants is not None else 10
-    
-    # Get actual subcolonies count (default is 4)
-    actual_subcolonies = args.subcolonies if args.subcolonies is not None else 4
-
-    print("===== Summary =====")
-    print(f"Solver binary   : {solver_path}")
-    print(f"Instances folder: {instances_root_display}")
-    print(f"Output CSV      : {output_path}")
-    print(f"Algorithm       : {args.alg}")
-    print(f"Ants            : {actual_ants}")
-    if args.alg == 2:
-        print(f"Sub-colonies    : {actual_subcolonies}")
-    print(f"q0              : {args.q0}")
-    print(f"rho             : {args.rho}")
-    print(f"bve             : {args.evap}")
-    print(f"Timeout         : {args.timeout}s")
-    print(f"Total puzzles   : {total}")
-    print(f"Succeeded       : {successes}")
-    print(f"Failed          : {failures}")
-    if total:
-        print(f"Average time    : {avg_time:.5f} s")
-        if avg_iterations is not None:
-            print(f"Average iters   : {avg_iterations:.2f}")
-        if args.alg == 2 and (overall_with_comm > 0 or overall_without_comm > 0):
-            print(f"With comm       : {overall_with_comm}/{overall_with_comm + overall_without_comm} ({(overall_with_comm / (overall_with_comm + overall_without_comm) * 100.0):.1f}%)")
-    else:
-        print(f"Average time    : n/a")
-    
-    sys.stdout.flush()  # Force immediate output to prevent timing issues
-
-    return 0
-
-
-if __name__ == "__main__":
-    sys.exit(main())
-
+#!/usr/bin/env python3
+"""
+Utility to batch-run all general Sudoku instances through the ACS solver.
+
+Example:
+    python scripts/run_general.py --verbose
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import math
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from subprocess import CompletedProcess, Popen, TimeoutExpired, run, PIPE, STDOUT
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# numpy is optional: a full sweep accumulates thousands of overall samples,
+# and its C-level reductions beat a Python-level sum at that size, but the
+# script stays stdlib-only when it is not installed.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# numba is likewise optional: when present, the big end-of-sweep reduction is
+# compiled once (cache=True persists across invocations) instead of going
+# through numpy's dispatch.
+if numpy is not None:
+    try:
+        from numba import njit
+
+        @njit(cache=True)
+        def _array_mean(a):
+            s = 0.0
+            for i in range(a.shape[0]):
+                s += a[i]
+            return s / a.shape[0]
+    except ImportError:
+        def _array_mean(a):
+            return a.mean()
+
+
+# Compiled once at import time: these patterns run for every line of every
+# solver invocation (thousands of times for the 100x logic-solvable runs), so
+# going through re.search's cache lookup per call is measurable overhead.
+_RE_INST = re.compile(r"inst(?P<size>[0-9x]+)_(?P<fixed>\d+)_(?P<idx>\d+)")
+_RE_SOLVED = re.compile(r"solved in ([0-9]*\.?[0-9]+)")
+_RE_FAILED = re.compile(r"failed in time ([0-9]*\.?[0-9]+)")
+_RE_ITER = re.compile(r"iterations:\s*([0-9]+)", re.IGNORECASE)
+_RE_COMM = re.compile(r"communication:\s*(yes|no)", re.IGNORECASE)
+_RE_CP_INITIAL = re.compile(r"cp_initial:\s*([0-9]*\.?[0-9]+)")
+_RE_CP_ANT = re.compile(r"cp_ant:\s*([0-9]*\.?[0-9]+)")
+_RE_CP_CALLS = re.compile(r"cp_calls:\s*([0-9]+)")
+_RE_NUMERIC = re.compile(r"(\d+)")
+
+
+class RunningStat:
+    """
+    Online mean/variance accumulator (Welford's algorithm).
+
+    Keeps summaries O(1) in memory instead of storing every sample; with
+    100 runs per logic-solvable instance the old per-group lists added up.
+    """
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def pstdev(self) -> float:
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
+@dataclass(slots=True)
+class GroupStats:
+    """Accumulated results for one (size, fixed%) group. Slotted attributes
+    instead of a dict: the hot recording path bumps these per run."""
+
+    total: int = 0
+    successes: int = 0
+    fails: int = 0
+    times: RunningStat = field(default_factory=RunningStat)
+    iterations: RunningStat = field(default_factory=RunningStat)
+    with_comm: int = 0
+    without_comm: int = 0
+    cp_initial: RunningStat = field(default_factory=RunningStat)
+    cp_ant: RunningStat = field(default_factory=RunningStat)
+    cp_calls: RunningStat = field(default_factory=RunningStat)
+
+
+@dataclass(frozen=True)
+class InstanceMetadata:
+    path: Path
+    size_label: str
+    fixed_percentage: Optional[int]
+    instance_id: Optional[int]
+    # Computed once in parse_metadata; the verbose print path reads this for
+    # every run, so it must not re-resolve the repo root each time.
+    relative_path: str
+
+
+@lru_cache(maxsize=1)
+def find_repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def default_solver_candidates() -> Sequence[str]:
+    if os.name == "nt":
+        return (
+            "sudoku_ants.exe",
+            "sudoku_ants",
+            os.path.join("vs2017", "x64", "Release", "sudoku_ants.exe"),
+            os.path.join("vs2017", "Release", "sudoku_ants.exe"),
+        )
+    return (
+        "./sudoku_ants",
+        "sudoku_ants",
+        os.path.join("vs2017", "x64", "Release", "sudoku_ants"),
+        os.path.join("vs2017", "Release", "sudoku_ants"),
+    )
+
+
+def resolve_solver_path(user_value: Optional[str]) -> Path:
+    repo_root = find_repo_root()
+    if user_value:
+        solver_path = Path(user_value)
+        if not solver_path.is_absolute():
+            solver_path = (repo_root / solver_path).resolve()
+        if solver_path.exists():
+            return solver_path
+        raise FileNotFoundError(f"Solver binary not found at '{solver_path}'.")
+
+    for candidate in default_solver_candidates():
+        candidate_path = (repo_root / candidate).resolve()
+        if candidate_path.exists() and candidate_path.is_file():
+            return candidate_path
+
+    raise FileNotFoundError(
+        "Solver binary not found. Build it first (e.g. run `make -f Makefile`)."
+    )
+
+
+@lru_cache(maxsize=4096)
+def _nat_key_name(name: str) -> tuple:
+    return tuple(int(part) if part.isdigit() else part for part in _RE_NUMERIC.split(name))
+
+
+def natural_sort_key(path: Path) -> tuple:
+    """
+    Generate a sort key that handles numeric parts naturally.
+    E.g., '9x9hard_2' comes before '9x9hard_10'
+
+    Memoized on the file name: the key is requested repeatedly while sorting
+    (and again as the sort_instance_metadata tie-breaker), so the regex split
+    runs once per distinct name.
+    """
+    return _nat_key_name(path.name)
+
+
+def iter_instance_files(instances_root: Path) -> Iterable[Path]:
+    if not instances_root.exists():
+        raise FileNotFoundError(f"Instances folder not found: '{instances_root}'.")
+    # One scandir pass picks up .txt files and extensionless files (for the
+    # "hard" folder); DirEntry.is_file comes from the directory read, so no
+    # extra stat per entry.
+    with os.scandir(instances_root) as entries:
+        all_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and (entry.name.endswith(".txt") or "." not in entry.name)
+        ]
+    # Sort naturally so 9x9hard_1, 9x9hard_2, ... 9x9hard_10 are in correct order
+    return sorted(all_files, key=natural_sort_key)
+
+
+def iter_all_instance_files(repo_root: Path) -> Iterable[Path]:
+    """Iterate over both general and logic-solvable instances."""
+    all_files: List[Path] = []
+
+    for subfolder in ("general", "logic-solvable"):
+        folder = repo_root / "instances" / subfolder
+        if folder.exists():
+            with os.scandir(folder) as entries:
+                all_files.extend(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False) and entry.name.endswith(".txt")
+                )
+
+    if not all_files:
+        raise FileNotFoundError("No instance files found in 'instances/general' or 'instances/logic-solvable'.")
+
+    return sorted(all_files)
+
+
+def parse_metadata(path: Path, repo_root: Path) -> InstanceMetadata:
+    name = path.stem
+    match = _RE_INST.match(name)
+    size = None
+    fixed = None
+    idx = None
+    if match:
+        size = match.group("size")
+        fixed = int(match.group("fixed"))
+        idx = int(match.group("idx"))
+    else:
+        # Logic-solvable instances: use puzzle name as size_label
+        size = name
+    try:
+        relative_path = str(path.relative_to(repo_root))
+    except ValueError:
+        relative_path = str(path)
+    return InstanceMetadata(path=path, size_label=size or "unknown", fixed_percentage=fixed, instance_id=idx, relative_path=relative_path)
+
+
+def sort_instance_metadata(instances: Sequence[InstanceMetadata]) -> List[InstanceMetadata]:
+    size_order = {"9x9": 0, "16x16": 1, "25x25": 2, "36x36": 3}
+
+    def key(meta: InstanceMetadata) -> Tuple[int, int, int, tuple]:
+        return (
+            size_order.get(meta.size_label, 99),
+            meta.fixed_percentage if meta.fixed_percentage is not None else 999,
+            meta.instance_id if meta.instance_id is not None else 999,
+            natural_sort_key(meta.path),
+        )
+
+    return sorted(instances, key=key)
+
+
+def format_instance_argument(instance_path: Path, repo_root: Path) -> str:
+    # Plain prefix check instead of Path.relative_to, whose ValueError-driven
+    # control flow is far more expensive than a string comparison and this
+    # runs once per solver invocation.
+    path_str = os.fspath(instance_path)
+    root_str = os.fspath(repo_root)
+    if path_str.startswith(root_str + os.sep):
+        path_str = "." + os.sep + path_str[len(root_str) + 1:]
+
+    # Quote paths with spaces (for Windows compatibility)
+    if ' ' in path_str:
+        return f'"{path_str}"'
+    return path_str
+
+
+def build_base_command(solver_path: Path, args: argparse.Namespace) -> List[str]:
+    """Build the constant part of the solver command line (everything except
+    the instance argument). Only --file changes between puzzles, so the
+    numeric parameters are stringified once per batch rather than per run."""
+    base: List[str] = [str(solver_path), "--alg", str(args.alg), "--timeout", str(args.timeout)]
+    if args.ants is not None:
+        base.extend(("--ants", str(args.ants)))
+    if args.subcolonies is not None:
+        base.extend(("--subcolonies", str(args.subcolonies)))
+    if args.q0 is not None:
+        base.extend(("--q0", str(args.q0)))
+    if args.rho is not None:
+        base.extend(("--rho", str(args.rho)))
+    if args.evap is not None:
+        base.extend(("--evap", str(args.evap)))
+    # Always add verbose for algorithms 0 and 2 to get iteration count
+    if args.alg == 0 or args.alg == 2 or args.solver_verbose:
+        base.append("--verbose")
+    return base
+
+
+def build_solver_command(base_cmd: Sequence[str], instance_path: Optional[Path], repo_root: Path) -> List[str]:
+    if instance_path is None:
+        # Persistent process mode: instance paths are fed on stdin instead.
+        return [base_cmd[0], "--stdin-loop", *base_cmd[1:]]
+    return [base_cmd[0], "--file", format_instance_argument(instance_path, repo_root), *base_cmd[1:]]
+
+
+class SolverLoop:
+    """
+    Client for the solver's --stdin-loop mode.
+
+    Keeps one solver process alive and feeds it instance file paths on stdin,
+    reading each report up to the __END__ sentinel. This avoids paying
+    fork/exec and loader startup for every puzzle, which dominates the cost of
+    fast 9x9 instances.
+    """
+
+    def __init__(self, cmd: Sequence[str], cwd: Path, timeout: Optional[float] = None) -> None:
+        self.cmd = list(cmd)
+        self.cwd = cwd
+        self.timeout = timeout
+        self._spawn()
+
+    def _spawn(self) -> None:
+        # stderr is merged into stdout so a single reader sees everything
+        # (including "could not open file" diagnostics) in order.
+        self.proc = Popen(self.cmd, cwd=str(self.cwd), stdin=PIPE, stdout=PIPE, stderr=STDOUT, text=True)
+
+    def solve(self, file_arg: str) -> Tuple[Optional[bool], Optional[float], Optional[int], Optional[bool], Optional[float], Optional[float], Optional[int], str, str]:
+        proc = self.proc
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(file_arg + "\n")
+        proc.stdin.flush()
+        # Feed each line straight into the parser rather than accumulating,
+        # joining and re-splitting the report; one pass, no intermediate list.
+        parser = SolverOutputParser()
+        # The per-invocation deadline applies here too: a wedged solver is
+        # killed at the deadline and replaced with a fresh loop process so
+        # later puzzles can still run if the caller continues.
+        timed_out = False
+        timer: Optional[threading.Timer] = None
+        if self.timeout is not None:
+            def _kill_on_deadline() -> None:
+                nonlocal timed_out
+                timed_out = True
+                proc.kill()
+
+            timer = threading.Timer(self.timeout, _kill_on_deadline)
+            timer.start()
+        try:
+            for line in proc.stdout:
+                if line.startswith("__END__"):
+                    return parser.result() + ("", "")
+                if not parser.complete():
+                    parser.feed(line)
+        finally:
+            if timer is not None:
+                timer.cancel()
+        proc.wait()
+        if timed_out:
+            self._spawn()
+            raise TimeoutExpired(self.cmd, self.timeout)
+        raise RuntimeError("solver exited unexpectedly in --stdin-loop mode")
+
+    def close(self) -> None:
+        if self.proc.stdin is not None:
+            self.proc.stdin.close()
+        self.proc.wait()
+
+
+def run_solver(cmd: Sequence[str], cwd: Path, timeout: Optional[float], show_progress: bool = False) -> CompletedProcess:
+    if show_progress:
+        # Don't capture stderr so progress messages show in real-time
+        return run(
+            list(cmd),
+            cwd=str(cwd),
+            stdout=PIPE,
+            stderr=None,  # Let stderr go directly to console
+            text=True,
+            timeout=timeout,
+        )
+    else:
+        return run(
+            list(cmd),
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+
+class SolverOutputParser:
+    """
+    Incremental parser for the solver's stdout/stderr lines.
+
+    Lines can be fed one at a time (streaming runs) or from a captured
+    buffer; complete() reports when every telemetry field has been seen so a
+    streaming reader can stop parsing trailing output early.
+    """
+
+    __slots__ = ("success", "solve_time", "iterations", "communication", "cp_initial", "cp_ant", "cp_calls", "_fallback_time")
+
+    def __init__(self) -> None:
+        self.success: Optional[bool] = None
+        self.solve_time: Optional[float] = None
+        self.iterations: Optional[int] = None
+        self.communication: Optional[bool] = None
+        self.cp_initial: Optional[float] = None
+        self.cp_ant: Optional[float] = None
+        self.cp_calls: Optional[int] = None
+        self._fallback_time: Optional[float] = None
+
+    def feed(self, line: str, is_stderr: bool = False) -> None:
+        # Cheap literal-substring checks pick the branch; the compiled regex
+        # (or a plain split) only runs on the line that actually matches,
+        # instead of running all seven patterns against every line.
+        line = line.strip()
+        if not line:
+            return
+        if self.success is None and (line == "0" or line == "1"):
+            self.success = (line == "0")
+        elif "solved in" in line:
+            solved_match = _RE_SOLVED.search(line)
+            if solved_match:
+                self.solve_time = float(solved_match.group(1))
+                self.success = True
+        elif "failed in time" in line:
+            failed_match = _RE_FAILED.search(line)
+            if failed_match:
+                self.solve_time = float(failed_match.group(1))
+                self.success = False
+        elif line.startswith("cp_initial:"):
+            # Slice past the known prefix; float()/int() accept the leading
+            # space, so no split or strip is needed.
+            self.cp_initial = float(line[11:])
+        elif line.startswith("cp_ant:"):
+            self.cp_ant = float(line[7:])
+        elif line.startswith("cp_calls:"):
+            self.cp_calls = int(line[9:])
+        elif line.startswith("communication:"):
+            self.communication = line.endswith("yes")
+        elif line.startswith("iterations:"):
+            self.iterations = int(line[11:])
+        elif "iterations:" in line.lower():
+            iter_match = _RE_ITER.search(line)
+            if iter_match:
+                self.iterations = int(iter_match.group(1))
+        elif self.success is None and "could not open file" in line.lower():
+            # Checked on both streams: SolverLoop merges stderr into stdout,
+            # so the diagnostic can arrive on either.
+            self.success = False
+        elif not is_stderr and self.solve_time is None and self._fallback_time is None:
+            # Non-verbose runs print the elapsed time as a bare float line.
+            # Only lines that look numeric get the float() attempt, so banner
+            # and solution text never pays the ValueError machinery.
+            if line[0].isdigit() or line[0] == ".":
+                try:
+                    self._fallback_time = float(line)
+                except ValueError:
+                    pass
+
+    def complete(self) -> bool:
+        return (
+            self.success is not None
+            and self.solve_time is not None
+            and self.iterations is not None
+            and self.communication is not None
+            and self.cp_initial is not None
+            and self.cp_ant is not None
+            and self.cp_calls is not None
+        )
+
+    def result(self) -> Tuple[Optional[bool], Optional[float], Optional[int], Optional[bool], Optional[float], Optional[float], Optional[int]]:
+        # Raw float; rounding happens once at report time (summaries and the
+        # verbose :.5f format) so aggregates stay unbiased.
+        solve_time = self.solve_time if self.solve_time is not None else self._fallback_time
+        return self.success, solve_time, self.iterations, self.communication, self.cp_initial, self.cp_ant, self.cp_calls
+
+
+def run_solver_streaming(cmd: Sequence[str], cwd: Path, timeout: Optional[float]) -> Tuple[Optional[bool], Optional[float], Optional[int], Optional[bool], Optional[float], Optional[float], Optional[int], str, str]:
+    """
+    Run the solver and parse its stdout line-by-line as it arrives.
+
+    Unlike run_solver + parse_solver_output, this never materializes the whole
+    output buffer, and parsing stops as soon as every telemetry field has been
+    seen; the remaining lines are only drained to let the process exit.
+    """
+    parser = SolverOutputParser()
+    proc = Popen(list(cmd), cwd=str(cwd), stdout=PIPE, stderr=PIPE, text=True, bufsize=1)
+    assert proc.stdout is not None and proc.stderr is not None
+    # stderr is drained on its own thread while stdout is parsed: alg 2
+    # streams progress to stderr, and a full stderr pipe would block the
+    # child before it ever closes stdout.
+    stderr_chunks: List[str] = []
+
+    def _drain_stderr() -> None:
+        stderr_chunks.append(proc.stderr.read())
+
+    stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
+    stderr_thread.start()
+    # The read loop blocks until the child closes stdout, so the deadline has
+    # to be enforced around the reads: a timer kills the child, which ends the
+    # loop at EOF, matching subprocess.run(timeout=...) semantics.
+    timed_out = False
+    timer: Optional[threading.Timer] = None
+    if timeout is not None:
+        def _kill_on_deadline() -> None:
+            nonlocal timed_out
+            timed_out = True
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill_on_deadline)
+        timer.start()
+    try:
+        for line in proc.stdout:
+            if not parser.complete():
+                parser.feed(line)
+        stderr_thread.join()
+    finally:
+        if timer is not None:
+            timer.cancel()
+    stderr_text = stderr_chunks[0] if stderr_chunks else ""
+    proc.wait()
+    if timed_out:
+        raise TimeoutExpired(list(cmd), timeout)
+    for line in stderr_text.splitlines():
+        parser.feed(line, is_stderr=True)
+    return parser.result() + ("", stderr_text)
+
+
+def parse_solver_output(stdout: str, stderr: str) -> Tuple[Optional[bool], Optional[float], Optional[int], Optional[bool], Optional[float], Optional[float], Optional[int], str, str]:
+    parser = SolverOutputParser()
+    # Stop scanning once every telemetry field has been seen; the solver can
+    # emit banner/solution text after the lines we care about.
+    for line in stdout.splitlines():
+        parser.feed(line)
+        if parser.complete():
+            break
+    if not parser.complete():
+        for line in stderr.splitlines():
+            parser.feed(line, is_stderr=True)
+            if parser.complete():
+                break
+    return parser.result() + (stdout, stderr)
+
+
+# Column order for the metrics CSV; summarize_group returns rows as tuples in
+# this order so csv.writer can emit them without per-row dict lookups.
+CSV_FIELDNAMES = ("alg", "puzzle_size", "f%", "ants", "subcolonies", "q0", "rho", "bve", "timeout", "success_rate", "time_mean", "time_std", "iter_mean", "with_comm", "without_comm", "cp_initial_mean", "cp_ant_mean", "cp_total_mean", "cp_percentage")
+
+
+def write_csv(output_path: Path, rows: Sequence[tuple]) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", newline="", encoding="utf-8", buffering=1 << 16) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(rows)
+
+
+def mean_of(values: Sequence[float]) -> float:
+    if not values:
+        return 0.0
+    # Below ~32 samples the array conversion costs more than it saves.
+    if numpy is not None and len(values) >= 32:
+        return float(_array_mean(numpy.ascontiguousarray(values, dtype=numpy.float64)))
+    return sum(values) / len(values)
+
+
+def compute_summary(total: int, successes: int, times: Sequence[float]) -> Tuple[int, int, float]:
+    return total, successes, round(mean_of(times), 5)
+
+
+def summarize_group(size_label: str, fixed_percentage: Optional[int], stats: GroupStats, args: argparse.Namespace) -> Optional[tuple]:
+    total = stats.total
+    if total == 0:
+        return None
+
+    successes = stats.successes
+    fails = stats.fails
+    times = stats.times
+    iterations = stats.iterations
+    with_comm = stats.with_comm
+    without_comm = stats.without_comm
+    cp_initial_stat = stats.cp_initial
+    cp_ant_stat = stats.cp_ant
+
+    success_rate = (successes / total) * 100.0 if total else 0.0
+    average_time = round(times.mean, 5) if times.n else 0.0
+    time_std = round(times.pstdev(), 5) if times.n > 1 else 0.0
+    average_iter = round(iterations.mean, 2) if iterations.n else 0.0
+
+    # Calculate CP timing statistics
+    avg_cp_initial = round(cp_initial_stat.mean, 6) if cp_initial_stat.n else 0.0
+    avg_cp_ant = round(cp_ant_stat.mean, 6) if cp_ant_stat.n else 0.0
+    avg_cp_total = avg_cp_initial + avg_cp_ant
+    avg_cp_percentage = round((avg_cp_total / average_time * 100), 2) if average_time > 0 else 0.0
+
+    label = size_label
+    if fixed_percentage is not None:
+        label = f"{label} @ {fixed_percentage}% fixed"
+
+    # Build summary message
+    summary_msg = f"Summary {label}: success={successes}, fail={fails}, success_rate={success_rate:.2f}%, avg_time={average_time:.5f}s"
+    
+    if iterations.n:
+        summary_msg += f", avg_iter={average_iter:.2f}"
+
+    if args.alg == 2 and (with_comm > 0 or without_comm > 0):
+        summary_msg += f", comm={with_comm}/{with_comm + without_comm}"
+
+    # Add CP timing to summary
+    if cp_initial_stat.n and cp_ant_stat.n:
+        summary_msg += f", CP: {avg_cp_total:.6f}s ({avg_cp_percentage:.1f}%)"
+    
+    # Summaries are printed after all runs complete; main flushes once at exit.
+    print(summary_msg)
+
+    # Get actual ant count (default is 10)
+    actual_ants = args.ants if args.ants is not None else 10
+    
+    # Get actual subcolonies count (default is 4)
+    actual_subcolonies = args.subcolonies if args.subcolonies is not None else 4
+
+    # Row tuple in CSV_FIELDNAMES order
+    return (
+        args.alg,
+        size_label,
+        fixed_percentage if fixed_percentage is not None else "",
+        actual_ants,
+        actual_subcolonies,
+        args.q0,
+        args.rho,
+        args.evap,
+        args.timeout,
+        round(success_rate, 2),
+        average_time,
+        time_std,
+        average_iter if (args.alg == 0 or args.alg == 2) else "",
+        with_comm if args.alg == 2 else "",
+        without_comm if args.alg == 2 else "",
+        avg_cp_initial if cp_initial_stat.n else "",
+        avg_cp_ant if cp_ant_stat.n else "",
+        avg_cp_total if (cp_initial_stat.n and cp_ant_stat.n) else "",
+        avg_cp_percentage if (cp_initial_stat.n and cp_ant_stat.n) else "",
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run all general Sudoku instances through the solver.")
+    parser.add_argument("--instances-root", default=None, help="Folder containing instances (default: runs both instances/general AND instances/logic-solvable)")
+    parser.add_argument("--solver", default=None, help="Path to the solver executable (default: auto-detect)")
+    parser.add_argument("--output", default="results/general_metrics.csv", help="Destination CSV file for metrics.")
+    parser.add_argument("--alg", type=int, default=0, help="Solver algorithm (0=ACS, 1=backtracking).")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Timeout per puzzle in seconds (default: 120).")
+    parser.add_argument("--ants", type=int, default=None, help="Override number of ants (ACS only).")
+    parser.add_argument("--subcolonies", type=int, default=None, help="Number of sub-colonies for parallel ACS (alg=2, default: 4).")
+    parser.add_argument("--q0", type=float, default=0.9, help="Override ACS q0 parameter.")
+    parser.add_argument("--rho", type=float, default=0.9, help="Override ACS rho parameter.")
+    parser.add_argument("--evap", type=float, default=0.005, help="Override ACS evaporation parameter.")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of solver processes to run concurrently (default: 1, so reported times are not skewed by CPU contention).")
+    parser.add_argument("--stdin-loop", dest="stdin_loop", action="store_true", help="Reuse one persistent solver process (requires a solver built with --stdin-loop support; implies --jobs 1).")
+    parser.add_argument("--limit", type=int, default=None, help="Optional cap on number of instances to process.")
+    parser.add_argument("--puzzle-size", dest="puzzle_sizes", nargs="+", choices=["9x9", "16x16", "25x25", "36x36"], help="Filter by puzzle size(s), e.g. --puzzle-size 25x25.")
+    parser.add_argument("--fixed-percentage", dest="fixed_percentages", type=int, nargs="+", help="Filter by fixed-cell percentage(s), e.g. --fixed-percentage 40.")
+    parser.add_argument("--solver-timeout", type=float, default=None, help="Wall-clock timeout applied to each solver invocation.")
+    parser.add_argument("--solver-verbose", action="store_true", help="Pass --verbose to the solver binary.")
+    parser.add_argument("--verbose", action="store_true", default=True, help="Print per-instance progress to the console (default: True).")
+    parser.add_argument("--no-verbose", dest="verbose", action="store_false", help="Disable per-instance progress output.")
+
+    args = parser.parse_args()
+
+    repo_root = find_repo_root()
+
+    try:
+        solver_path = resolve_solver_path(args.solver)
+    except FileNotFoundError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    # Determine which instances to run
+    if args.instances_root is not None:
+        # User specified a specific folder
+        instances_root = (repo_root / args.instances_root).resolve()
+        try:
+            instance_files = list(iter_instance_files(instances_root))
+        except FileNotFoundError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        if not instance_files:
+            print(f"No instances found in '{instances_root}'.", file=sys.stderr)
+            return 1
+        instances_root_display = instances_root
+    else:
+        # Default: run both general and logic-solvable instances
+        try:
+            instance_files = list(iter_all_instance_files(repo_root))
+        except FileNotFoundError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        instances_root_display = repo_root / "instances" / "(general + logic-solvable)"
+
+    metadata_list = sort_instance_metadata([parse_metadata(path, repo_root) for path in instance_files])
+
+    if args.puzzle_sizes:
+        allowed_sizes = set(args.puzzle_sizes)
+        metadata_list = [meta for meta in metadata_list if meta.size_label in allowed_sizes]
+
+    if args.fixed_percentages:
+        allowed_fixed = set(args.fixed_percentages)
+        metadata_list = [
+            meta
+            for meta in metadata_list
+            if meta.fixed_percentage is not None and meta.fixed_percentage in allowed_fixed
+        ]
+
+    if not metadata_list:
+        print("No instances match the specified filters.", file=sys.stderr)
+        return 1
+
+    if args.limit is not None:
+        metadata_list = metadata_list[: args.limit]
+
+    group_rows: List[tuple] = []
+    total_instances = len(metadata_list)
+    # Results can arrive out of order in the parallel path, so stats are keyed
+    # per (size, fixed%) group and summarized once all runs have finished.
+    group_stats_by_key: dict = {}
+    overall_total = 0
+    overall_successes = 0
+    overall_times: List[float] = []
+    overall_iterations: List[int] = []
+    overall_with_comm = 0
+    overall_without_comm = 0
+
+    # Build the full task list up front: (instance index, metadata, run number,
+    # total runs). Logic-solvable instances are run 100x, general ones once.
+    tasks: List[Tuple[int, InstanceMetadata, int, int]] = []
+    for idx, metadata in enumerate(metadata_list, start=1):
+        num_runs = 100 if metadata.fixed_percentage is None else 1
+        group_key = (metadata.size_label, metadata.fixed_percentage)
+        if group_key not in group_stats_by_key:
+            group_stats_by_key[group_key] = GroupStats()
+        for run_num in range(1, num_runs + 1):
+            tasks.append((idx, metadata, run_num, num_runs))
+
+    # Parallelism is opt-in: the script's whole point is timing metrics, and
+    # concurrent solver processes (especially multithreaded --alg 2) contend
+    # for cores and inflate the measured times.
+    max_workers = 1 if args.stdin_loop else max(1, args.jobs)
+    # Progress streaming writes the solver's stderr straight to the console,
+    # which only makes sense when runs are serialized.
+    show_progress = args.verbose and args.alg == 2 and max_workers == 1 and not args.stdin_loop
+
+    base_cmd = build_base_command(solver_path, args)
+
+    solver_loop: Optional[SolverLoop] = None
+    if args.stdin_loop:
+        solver_loop = SolverLoop(build_solver_command(base_cmd, None, repo_root), repo_root, timeout=args.solver_timeout)
+
+    def execute_task(task: Tuple[int, InstanceMetadata, int, int]):
+        _, metadata, _, _ = task
+        if solver_loop is not None:
+            return solver_loop.solve(format_instance_argument(metadata.path, repo_root))
+        cmd = build_solver_command(base_cmd, metadata.path, repo_root)
+        if show_progress:
+            # Progress streaming hands stderr to the console, so fall back to
+            # capturing stdout whole.
+            result = run_solver(cmd, repo_root, timeout=args.solver_timeout, show_progress=True)
+            return parse_solver_output(result.stdout, result.stderr if result.stderr else "")
+        return run_solver_streaming(cmd, repo_root, timeout=args.solver_timeout)
+
+    def record_result(task: Tuple[int, InstanceMetadata, int, int], parsed) -> None:
+        nonlocal overall_total, overall_successes, overall_with_comm, overall_without_comm
+        idx, metadata, run_num, num_runs = task
+        is_logic_solvable = metadata.fixed_percentage is None
+        success, solve_time, iterations, communication, cp_initial, cp_ant, cp_calls, stdout_text, stderr_text = parsed
+
+        if success is False and (solve_time is None or solve_time == 0.0):
+            solve_time = round(float(args.timeout), 5)
+
+        if args.verbose:
+            status = "OK" if success else "FAIL" if success is not None else "UNKNOWN"
+
+            # Build detailed timing string
+            timing_str = ""
+            if solve_time is not None:
+                timing_str = f"{solve_time:.5f}s"
+
+                # Add detailed CP breakdown if available
+                if cp_initial is not None and cp_ant is not None and iterations is not None:
+                    total_cp = cp_initial + cp_ant
+                    aco_only = max(0.0, solve_time - total_cp)  # Pure ACO time (excluding CP)
+                    total_aco = solve_time - cp_initial  # ACO phase (including ant CP)
+
+                    # Calculate percentages
+                    cp_init_pct = (cp_initial / solve_time * 100) if solve_time > 0 else 0
+                    cp_ant_pct = (cp_ant / total_aco * 100) if total_aco > 0 else 0
+                    aco_only_pct = (aco_only / total_aco * 100) if total_aco > 0 else 0
+                    total_cp_pct = (total_cp / solve_time * 100) if solve_time > 0 else 0
+                    aco_total_pct = (total_aco / solve_time * 100) if solve_time > 0 else 0
+
+                    # Format with percentages (using 2 decimal places to show small values like CP_init)
+                    timing_str = (f"CP_init={cp_initial:.6f}s ({cp_init_pct:.2f}%), "
+                                f"CP_ant={cp_ant:.6f}s ({cp_ant_pct:.2f}%), "
+                                f"ACO_only={aco_only:.5f}s ({aco_only_pct:.2f}%), "
+                                f"ACO_total={total_aco:.5f}s ({aco_total_pct:.2f}%), "
+                                f"total_CP={total_cp:.6f}s ({total_cp_pct:.2f}%), "
+                                f"Total={solve_time:.5f}s, {iterations} iter")
+                elif iterations is not None:
+                    timing_str += f", {iterations} iter"
+
+            # Compose the whole line and emit it with one write: a run's
+            # message stays line-atomic and there is no per-run flush.
+            if is_logic_solvable:
+                # For logic-solvable, show run number
+                prefix = f"[run {run_num}/{num_runs}]"
+            else:
+                # For general instances, show instance position
+                prefix = f"[{idx}/{total_instances}]"
+            if timing_str:
+                sys.stdout.write(f"{prefix} {metadata.relative_path} -> {status} ({timing_str})\n")
+            else:
+                sys.stdout.write(f"{prefix} {metadata.relative_path} -> {status}\n")
+
+        group_stats = group_stats_by_key[(metadata.size_label, metadata.fixed_percentage)]
+        group_stats.total += 1
+        if success:
+            group_stats.successes += 1
+        else:
+            group_stats.fails += 1
+        # Only include times and iterations from successful runs in statistics
+        if success and solve_time is not None:
+            group_stats.times.push(solve_time)
+            if iterations is not None:
+                group_stats.iterations.push(iterations)
+            if communication is not None:
+                if communication:
+                    group_stats.with_comm += 1
+                else:
+                    group_stats.without_comm += 1
+            # Track CP timing statistics
+            if cp_initial is not None:
+                group_stats.cp_initial.push(cp_initial)
+            if cp_ant is not None:
+                group_stats.cp_ant.push(cp_ant)
+            if cp_calls is not None:
+                group_stats.cp_calls.push(cp_calls)
+
+        overall_total += 1
+        if success:
+            overall_successes += 1
+        # Only include times and iterations from successful runs in statistics
+        if success and solve_time is not None:
+            overall_times.append(solve_time)
+            if iterations is not None:
+                overall_iterations.append(iterations)
+            if communication is not None:
+                if communication:
+                    overall_with_comm += 1
+                else:
+                    overall_without_comm += 1
+
+    async def run_all_async() -> None:
+        # Bounded asyncio subprocesses instead of a thread pool: the event
+        # loop overlaps fork/exec setup with draining finished puzzles, uses
+        # posix_spawn where available, and needs no worker threads or locks
+        # since results are recorded on the loop thread.
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run_one(task: Tuple[int, InstanceMetadata, int, int]) -> None:
+            _, metadata, _, _ = task
+            cmd = build_solver_command(base_cmd, metadata.path, repo_root)
+            async with semaphore:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    cwd=str(repo_root),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(), args.solver_timeout)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+            record_result(task, parse_solver_output(stdout.decode(), stderr.decode()))
+
+        await asyncio.gather(*(run_one(task) for task in tasks))
+
+    try:
+        if max_workers > 1:
+            asyncio.run(run_all_async())
+        else:
+            for task in tasks:
+                record_result(task, execute_task(task))
+    finally:
+        if solver_loop is not None:
+            solver_loop.close()
+
+    output_path = (repo_root / args.output).resolve()
+    for group_key, group_stats in group_stats_by_key.items():
+        row = summarize_group(group_key[0], group_key[1], group_stats, args)
+        if row:
+            group_rows.append(row)
+
+    write_csv(output_path, group_rows)
+
+    total, successes, avg_time = compute_summary(overall_total, overall_successes, overall_times)
+    failures = total - successes
+    avg_iterations = round(mean_of(overall_iterations), 2) if overall_iterations else None
+
+    # Get actual ant count (default is 10)
+    actual_ants = args.ants if args.ants is not None else 10
+    
+    # Get actual subcolonies count (default is 4)
+    actual_subcolonies = args.subcolonies if args.subcolonies is not None else 4
+
+    print("===== Summary =====")
+    print(f"Solver binary   : {solver_path}")
+    print(f"Instances folder: {instances_root_display}")
+    print(f"Output CSV      : {output_path}")
+    print(f"Algorithm       : {args.alg}")
+    print(f"Ants            : {actual_ants}")
+    if args.alg == 2:
+        print(f"Sub-colonies    : {actual_subcolonies}")
+    print(f"q0              : {args.q0}")
+    print(f"rho             : {args.rho}")
+    print(f"bve             : {args.evap}")
+    print(f"Timeout         : {args.timeout}s")
+    print(f"Total puzzles   : {total}")
+    print(f"Succeeded       : {successes}")
+    print(f"Failed          : {failures}")
+    if total:
+        print(f"Average time    : {avg_time:.5f} s")
+        if avg_iterations is not None:
+            print(f"Average iters   : {avg_iterations:.2f}")
+        if args.alg == 2 and (overall_with_comm > 0 or overall_without_comm > 0):
+            print(f"With comm       : {overall_with_comm}/{overall_with_comm + overall_without_comm} ({(overall_with_comm / (overall_with_comm + overall_without_comm) * 100.0):.1f}%)")
+    else:
+        print(f"Average time    : n/a")
+    
+    sys.stdout.flush()  # Force immediate output to prevent timing issues
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
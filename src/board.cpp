@@ -123,11 +123,31 @@ Board::Board(const Board &other)
 	Copy(other);
 }
 
+/*******************************************************************************
+ * Assignment operator - Deep copy via Copy
+ *
+ * Without this the compiler-generated assignment shares the cells pointer
+ * between boards, which double-frees once both are destroyed.
+ ******************************************************************************/
+Board& Board::operator=(const Board &other)
+{
+	if ( this != &other )
+		Copy(other);
+	return *this;
+}
+
 /*******************************************************************************
  * Copy - Deep copy another board's state
  ******************************************************************************/
 void Board::Copy(const Board& other)
 {
+	// Reallocate if this board was sized for a different puzzle
+	if ( cells != nullptr && numCells != other.CellCount() )
+	{
+		delete [] cells;
+		cells = nullptr;
+	}
+
 	order = other.order;
 	numUnits = order * order;
 	numCells = numUnits * numUnits;
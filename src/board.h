@@ -17,6 +17,7 @@ public:
 	Board(){};
 	Board(const string &puzzleString);
 	Board(const Board &other);
+	Board& operator=(const Board &other);
 	~Board();
 
 	string AsString(bool useNumbers=false, bool showUnfixed = false);
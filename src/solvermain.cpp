@@ -29,6 +29,7 @@
 #include <string>
 #include <iomanip>
 #include <sstream>
+#include <vector>
 using namespace std;
 
 static string JsonEscape(const string &input)
@@ -110,53 +111,20 @@ string ReadFile( string fileName )
 }
 
 // ============================================================================
-// SECTION 2: MAIN FUNCTION
+// SECTION 2: SOLVE AND REPORT
 // ============================================================================
 
 /*******************************************************************************
- * main - Entry point for the Sudoku solver
- * 
- * This function orchestrates the entire solving process:
- * 1. Parse command-line arguments
- * 2. Load puzzle
- * 3. Initialize board (applies constraint propagation)
- * 4. Configure and run selected algorithm
- * 5. Validate and output results
+ * SolveAndReport - Solve one puzzle and write results to stdout
+ *
+ * Shared between the one-shot command-line path and the --stdin-loop mode.
+ *
+ * 1. Initialize board (applies constraint propagation)
+ * 2. Configure and run selected algorithm
+ * 3. Validate and output results
  ******************************************************************************/
-int main( int argc, char *argv[] )
+static void SolveAndReport( const string &puzzleString, Arguments &a )
 {
-	// ========================================================================
-	// SECTION 2.1: COMMAND-LINE ARGUMENT PARSING
-	// ========================================================================
-	
-	Arguments a( argc, argv );
-	string puzzleString;
-	
-	// Option 1: Generate blank puzzle of specified order
-	if ( a.GetArg("blank", 0) && a.GetArg("order", 0))
-	{
-		int order = a.GetArg("order", 0);
-		if ( order != 0 )
-			puzzleString = string(order*order*order*order,'.');
-	}
-	// Option 2: Read puzzle from command line or file
-	else 
-	{
-		// Try reading from command-line argument
-		puzzleString = a.GetArg(string("puzzle"),string());
-		if ( puzzleString.length() == 0 )
-		{
-			// Try reading from file
-			string fileName = a.GetArg(string("file"),string());
-			puzzleString = ReadFile(fileName);
-		}
-		if ( puzzleString.length() == 0 )
-		{
-			cerr << "no puzzle specified" << endl;
-			exit(0);
-		}
-	}
-	
 	// Reset CP timing before starting
 	ResetCPTiming();
 	
@@ -294,7 +262,8 @@ int main( int argc, char *argv[] )
 		cout << "\"cp_calls\":" << cpCallCount << ",";
 		cout << "\"cp_total\":" << totalCPTime;
 		cout << "}" << endl;
-		return 0;
+		delete solver;
+		return;
 	}
 
 	// Output results
@@ -359,4 +328,118 @@ int main( int argc, char *argv[] )
 		cout << "\nCP overhead:        " << cpPercentage << "% of total time" << endl;
 		cout << "ACO computation:    " << (100.0f - cpPercentage) << "% of total time" << endl;
 	}
+
+	delete solver;
+}
+
+// ============================================================================
+// SECTION 3: MAIN FUNCTION
+// ============================================================================
+
+/*******************************************************************************
+ * main - Entry point for the Sudoku solver
+ *
+ * This function orchestrates the entire solving process:
+ * 1. Parse command-line arguments
+ * 2. Load puzzle (or enter --stdin-loop mode)
+ * 3. Solve and report via SolveAndReport
+ *
+ * In --stdin-loop mode the process stays alive and reads one puzzle file
+ * path per line from stdin, solving each with the configured parameters and
+ * terminating each report with an "__END__" sentinel line. This lets batch
+ * drivers reuse a single process instead of paying fork/exec per puzzle.
+ ******************************************************************************/
+int main( int argc, char *argv[] )
+{
+	// ========================================================================
+	// SECTION 3.1: COMMAND-LINE ARGUMENT PARSING
+	// ========================================================================
+
+	Arguments a( argc, argv );
+	string puzzleString;
+
+	// Option 1: Server mode for long-lived worker processes. Each stdin line
+	// is a full request in command-line syntax (e.g. "--puzzle ... --alg 0
+	// --json"); the reply is the usual report, one JSON line per request
+	// when --json is included. Reuses the Arguments parser on the tokenized
+	// line so server requests accept exactly the same options as argv.
+	if ( a.GetArg("server", 0) )
+	{
+		string line;
+		while ( getline(cin, line) )
+		{
+			if ( line.empty() )
+				continue;
+			vector<string> tokens;
+			tokens.push_back(string(argv[0]));
+			istringstream iss(line);
+			string token;
+			while ( iss >> token )
+				tokens.push_back(token);
+			vector<char*> tokenPtrs;
+			for ( string &t : tokens )
+				tokenPtrs.push_back(&t[0]);
+			Arguments request((int)tokenPtrs.size(), tokenPtrs.data());
+			puzzleString = request.GetArg(string("puzzle"),string());
+			if ( puzzleString.length() == 0 )
+			{
+				string fileName = request.GetArg(string("file"),string());
+				if ( fileName.length() != 0 )
+					puzzleString = ReadFile(fileName);
+			}
+			if ( puzzleString.length() == 0 )
+				cout << "{\"success\":false,\"error\":\"no puzzle specified\"}" << endl;
+			else
+				SolveAndReport(puzzleString, request);
+			cout.flush();
+			cerr.flush();
+		}
+		return 0;
+	}
+
+	// Option 2: Serve puzzles from stdin, one file path per line
+	if ( a.GetArg("stdin-loop", 0) )
+	{
+		string fileName;
+		while ( getline(cin, fileName) )
+		{
+			if ( fileName.empty() )
+				continue;
+			puzzleString = ReadFile(fileName);
+			if ( puzzleString.length() != 0 )
+				SolveAndReport(puzzleString, a);
+			cout << "__END__" << endl;
+			cout.flush();
+			cerr.flush();
+		}
+		return 0;
+	}
+
+	// Option 3: Generate blank puzzle of specified order
+	if ( a.GetArg("blank", 0) && a.GetArg("order", 0))
+	{
+		int order = a.GetArg("order", 0);
+		if ( order != 0 )
+			puzzleString = string(order*order*order*order,'.');
+	}
+	// Option 4: Read puzzle from command line or file
+	else
+	{
+		// Try reading from command-line argument
+		puzzleString = a.GetArg(string("puzzle"),string());
+		if ( puzzleString.length() == 0 )
+		{
+			// Try reading from file
+			string fileName = a.GetArg(string("file"),string());
+			puzzleString = ReadFile(fileName);
+		}
+		if ( puzzleString.length() == 0 )
+		{
+			cerr << "no puzzle specified" << endl;
+			exit(0);
+		}
+	}
+
+	SolveAndReport(puzzleString, a);
+	return 0;
 }
@@ -5,6 +5,7 @@
 class SudokuSolver
 {
 public:
+	virtual ~SudokuSolver() {}
 	virtual bool Solve(const Board& puzzle, float maxTime) = 0;
 	virtual float GetSolutionTime() = 0;
 	virtual const Board& GetSolution() = 0;